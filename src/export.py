@@ -0,0 +1,244 @@
+import argparse  # Import argparse for command line arguments.
+import gzip  # Import gzip for compressed NDJSON files.
+import importlib.util  # Import importlib to check optional dependencies.
+import itertools  # Import itertools for chunked writes.
+import json  # import library JSON for work with it.
+import logging  # import the logging library for logging tasks.
+import math  # Import math for NaN checks.
+import os  # Import os for path handling.
+from typing import Any, Dict, Iterable, Iterator, List  # Import type annotations for better code.
+
+import pandas as pd  # import pandas for data processing and analysis.
+
+from src.reports import filter_category_expenses  # import a desired function
+from src.services import search_by_description  # import a desired function
+from src.utils import build_card_index, load_xlsx_data  # import a desired function
+from src.views import analyze_card_usage, largest_transactions  # import a desired function
+
+# Module logger (the export.log file handler is attached only when run from the command line)
+logger = logging.getLogger(__name__)
+
+# Path to the operations file, independent of the working directory.
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "operations.xls")
+
+# Stable schemas of the exported datasets: column -> Arrow type (column order is part of the schema).
+OPERATIONS_SCHEMA = {
+    "Дата операции": "string",
+    "Дата платежа": "string",
+    "Номер карты": "string",
+    "Статус": "string",
+    "Сумма операции": "float64",
+    "Валюта операции": "string",
+    "Сумма платежа": "float64",
+    "Валюта платежа": "string",
+    "Кэшбэк": "float64",
+    "Категория": "string",
+    "MCC": "float64",
+    "Описание": "string",
+    "Бонусы (включая кэшбэк)": "float64",
+    "Округление на инвесткопилку": "float64",
+    "Сумма операции с округлением": "float64",
+}
+CARD_USAGE_SCHEMA = {"end_digits": "string", "spent": "float64", "bonus": "float64"}
+TOP_TRANSACTIONS_SCHEMA = {"date": "string", "amount": "float64", "category": "string", "description": "string"}
+
+EXPORT_FORMATS = ("ndjson", "parquet", "arrow")
+CHUNK_SIZE = 1000  # Rows per chunk (NDJSON write, Parquet row group, Arrow record batch).
+
+
+# Brings a record to the schema: fixed key order, missing keys and NaN become None.
+def conform_record(record: Dict[str, Any], schema: Dict[str, str]) -> Dict[str, Any]:
+    conformed = {}
+    for column, column_type in schema.items():
+        value = record.get(column)
+        if isinstance(value, float) and math.isnan(value):
+            value = None
+        elif isinstance(value, pd.Timestamp):
+            value = value.strftime("%Y-%m-%d %H:%M:%S")
+        elif value is not None and column_type == "string":
+            value = str(value)
+        elif value is not None and column_type == "float64":
+            value = float(value)
+        conformed[column] = value
+    return conformed
+
+
+# Splits the records into chunks of conformed records without loading them all into memory.
+def iter_chunks(
+    records: Iterable[Dict[str, Any]], schema: Dict[str, str], chunk_size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(records)
+    while True:
+        chunk = [conform_record(r, schema) for r in itertools.islice(iterator, chunk_size)]
+        if not chunk:
+            return
+        yield chunk
+
+
+# Builds the Arrow schema of a dataset (requires the "parquet" extra).
+def arrow_schema(schema: Dict[str, str]) -> Any:
+    import pyarrow as pa  # Optional dependency.
+
+    return pa.schema([(column, column_type) for column, column_type in schema.items()])
+
+
+# Writes the records to a gzip-compressed NDJSON file in chunks.
+def export_ndjson(
+    records: Iterable[Dict[str, Any]], file_path: str, schema: Dict[str, str], chunk_size: int = CHUNK_SIZE
+) -> int:
+    try:
+        rows_written = 0
+        with gzip.open(file_path, "wt", encoding="utf-8") as f:
+            for chunk in iter_chunks(records, schema, chunk_size):
+                f.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in chunk))  # Write one chunk at a time.
+                rows_written += len(chunk)
+        logger.info(f"Записано {rows_written} строк в файл {file_path}.")
+        return rows_written
+    except Exception as e:
+        logger.error(f"Ошибка при записи NDJSON: {e}")
+        raise
+
+
+# Reads a gzip-compressed NDJSON file record by record.
+def read_ndjson(file_path: str) -> Iterator[Dict[str, Any]]:
+    with gzip.open(file_path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+# Writes the records to a Parquet file, one row group per chunk (requires the "parquet" extra).
+def export_parquet(
+    records: Iterable[Dict[str, Any]], file_path: str, schema: Dict[str, str], chunk_size: int = CHUNK_SIZE
+) -> int:
+    try:
+        import pyarrow as pa  # Optional dependency.
+        import pyarrow.parquet as pq
+
+        rows_written = 0
+        dataset_schema = arrow_schema(schema)
+        with pq.ParquetWriter(file_path, dataset_schema) as writer:
+            for chunk in iter_chunks(records, schema, chunk_size):
+                writer.write_table(pa.Table.from_pylist(chunk, schema=dataset_schema))  # One row group.
+                rows_written += len(chunk)
+        logger.info(f"Записано {rows_written} строк в файл {file_path}.")
+        return rows_written
+    except Exception as e:
+        logger.error(f"Ошибка при записи Parquet: {e}")
+        raise
+
+
+# Reads a Parquet file into an Arrow table using a memory map.
+def read_parquet(file_path: str) -> Any:
+    import pyarrow.parquet as pq  # Optional dependency.
+
+    return pq.read_table(file_path, memory_map=True)
+
+
+# Writes the records to an Arrow IPC file, one record batch per chunk (requires the "parquet" extra).
+def export_arrow(
+    records: Iterable[Dict[str, Any]], file_path: str, schema: Dict[str, str], chunk_size: int = CHUNK_SIZE
+) -> int:
+    try:
+        import pyarrow as pa  # Optional dependency.
+
+        rows_written = 0
+        dataset_schema = arrow_schema(schema)
+        with pa.OSFile(file_path, "wb") as sink, pa.ipc.new_file(sink, dataset_schema) as writer:
+            for chunk in iter_chunks(records, schema, chunk_size):
+                writer.write_batch(pa.RecordBatch.from_pylist(chunk, schema=dataset_schema))  # One record batch.
+                rows_written += len(chunk)
+        logger.info(f"Записано {rows_written} строк в файл {file_path}.")
+        return rows_written
+    except Exception as e:
+        logger.error(f"Ошибка при записи Arrow IPC: {e}")
+        raise
+
+
+# Reads an Arrow IPC file without copying: the table points into the memory-mapped file.
+def read_arrow(file_path: str) -> Any:
+    import pyarrow as pa  # Optional dependency.
+
+    with pa.memory_map(file_path, "r") as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+# Checks that the selected format can be written before any data is loaded.
+def check_export_format(file_format: str) -> None:
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Неизвестный формат экспорта: {file_format}")
+    if file_format in ("parquet", "arrow") and importlib.util.find_spec("pyarrow") is None:
+        raise ImportError(f"Для формата {file_format} установите pyarrow: poetry install --extras parquet")
+
+
+# Writes one dataset in the selected format and returns the file path.
+def export_dataset(
+    records: Iterable[Dict[str, Any]],
+    output_dir: str,
+    name: str,
+    schema: Dict[str, str],
+    file_format: str = "ndjson",
+    chunk_size: int = CHUNK_SIZE,
+) -> str:
+    check_export_format(file_format)
+    if file_format == "parquet":
+        file_path = os.path.join(output_dir, f"{name}.parquet")
+        export_parquet(records, file_path, schema, chunk_size)
+    elif file_format == "arrow":
+        file_path = os.path.join(output_dir, f"{name}.arrow")
+        export_arrow(records, file_path, schema, chunk_size)
+    else:
+        file_path = os.path.join(output_dir, f"{name}.ndjson.gz")
+        export_ndjson(records, file_path, schema, chunk_size)
+    return file_path
+
+
+# Exports search results, the category report and home page data.
+def main_export(
+    query: str, category: str, date_for_report: str, output_dir: str, file_format: str = "ndjson"
+) -> List[str]:
+    try:
+        check_export_format(file_format)
+        report_date = pd.to_datetime(date_for_report, format="%Y-%m-%d")
+
+        transactions = load_xlsx_data(DATA_PATH)
+        card_index = build_card_index(transactions)
+        os.makedirs(output_dir, exist_ok=True)
+
+        search_results = search_by_description(transactions, query)
+        category_report = filter_category_expenses(pd.DataFrame(transactions), category, report_date).to_dict(
+            orient="records"
+        )  # Same 3-month window as the category report.
+        card_usage = analyze_card_usage(transactions, card_index)
+        top_transactions = largest_transactions(transactions)
+
+        exported = [
+            export_dataset(search_results, output_dir, "search_results", OPERATIONS_SCHEMA, file_format),
+            export_dataset(category_report, output_dir, "category_report", OPERATIONS_SCHEMA, file_format),
+            export_dataset(card_usage, output_dir, "card_usage", CARD_USAGE_SCHEMA, file_format),
+            export_dataset(top_transactions, output_dir, "top_transactions", TOP_TRANSACTIONS_SCHEMA, file_format),
+        ]
+        print(f"Данные экспортированы: {exported}")
+        return exported
+    except Exception as e:
+        logger.error(f"Ошибка в функции main_export: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Экспорт обработанных данных")
+    parser.add_argument("--query", required=True, help="Поисковый запрос по описанию")
+    parser.add_argument("--category", default="Супермаркеты", help="Категория для отчета")
+    parser.add_argument("--date", required=True, help="Дата отчета в формате ГГГГ-ММ-ДД")
+    parser.add_argument("--output-dir", default="export", help="Каталог для файлов экспорта")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson", help="Формат файлов")
+    args = parser.parse_args()
+
+    # Logging Setup (own file, the root logger is already configured by the imported modules)
+    handler = logging.FileHandler("export.log", encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(asctime)s:%(levelname)s:%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    main_export(args.query, args.category, args.date, args.output_dir, args.format)
@@ -1,8 +1,11 @@
 import json  # import library JSON for work with it.
 import logging  # import the logging library for logging tasks.
+from typing import Any, Dict, List  # Import type annotations for better code.
 
 import pandas as pd  # import pandas for data processing and analysis.
 
+from src.utils import get_card_operations  # import a desired function
+
 # Logging Setup
 logging.basicConfig(filename="reports.log", level=logging.INFO, format="%(asctime)s:%(levelname)s:%(message)s")
 
@@ -44,6 +47,18 @@ def find_transactions(keyword: str) -> str:
         raise
 
 
+# Selects the operations of the category for the last 3 months before the report date.
+def filter_category_expenses(
+    data_frame: pd.DataFrame, selected_category: str, date_for_report: pd.Timestamp
+) -> pd.DataFrame:
+    payment_dates = pd.to_datetime(data_frame["Дата платежа"], format="%d.%m.%Y")
+    return data_frame[
+        (data_frame["Категория"] == selected_category)  # Filter by category.
+        & (payment_dates >= date_for_report - pd.DateOffset(months=3))  # Last 3 months.
+        & (payment_dates <= date_for_report)  # Up to the given date.
+    ]
+
+
 # Calculation of expenditures for the selected category.
 def calculate_expenses(data_frame: pd.DataFrame, selected_category: str, date_for_report: pd.Timestamp) -> str:
     try:
@@ -52,11 +67,7 @@ def calculate_expenses(data_frame: pd.DataFrame, selected_category: str, date_fo
         logging.info("Дата платежа преобразована в формат datetime.")
 
         # Write down the expenses for the last 3 months.
-        relevant_expenses = data_frame[
-            (data_frame["Категория"] == selected_category)  # Filter by category.
-            & (data_frame["Дата платежа"] >= date_for_report - pd.DateOffset(months=3))  # Last 3 months.
-            & (data_frame["Дата платежа"] <= date_for_report)  # Up to the given date.
-            ]
+        relevant_expenses = filter_category_expenses(data_frame, selected_category, date_for_report)
 
         # Sum the payment amounts.
         expenses_sum = relevant_expenses["Сумма платежа"].astype(float).sum()
@@ -81,6 +92,38 @@ def calculate_expenses(data_frame: pd.DataFrame, selected_category: str, date_fo
         raise
 
 
+# Calculation of expenditures by category for a single card.
+def calculate_card_expenses(transactions: List[Dict[str, Any]], card_index: Dict[str, Any], card_number: Any) -> str:
+    try:
+        # Take only the operations of the card from the card index.
+        card_operations = get_card_operations(transactions, card_index, card_number)
+
+        # Sum the expenses of the card by category.
+        expenses_by_category: Dict[str, float] = {}
+        for operation in card_operations:
+            transaction_amount = operation.get("Сумма операции", 0)
+            if transaction_amount < 0:
+                category = str(operation.get("Категория"))
+                expenses_by_category[category] = expenses_by_category.get(category, 0.0) + abs(transaction_amount)
+        logging.info(f"Расходы по карте {card_number} рассчитаны.")
+
+        # Create JSON result.
+        calculation_result = json.dumps(
+            {
+                "Номер карты": str(card_number),
+                "Количество операций": len(card_operations),
+                "Расходы по категориям": expenses_by_category,
+            },
+            indent=4,
+            ensure_ascii=False,
+        )
+        logging.info("Расходы по карте успешно преобразованы в JSON.")
+        return calculation_result
+    except Exception as e:
+        logging.error(f"Ошибка при расчете расходов по карте: {e}")
+        raise
+
+
 # Run transaction analysis and costing.
 def main_reports(selected_category: str, date_for_report: str) -> None:
     try:
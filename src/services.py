@@ -1,10 +1,12 @@
 import json  # import library JSON for work with it.
 import logging  # import the logging library for logging tasks.
 import re  # Import regular expression library for string matching.
-from typing import Dict, List  # Import Dict and List for type annotations.
+from typing import Any, Dict, List  # Import Any, Dict and List for type annotations.
 
 import pandas as pd  # import pandas for data processing and analysis.
 
+from src.utils import get_card_operations  # import a desired function
+
 # Logging Setup
 logging.basicConfig(filename="services.log", level=logging.INFO, format="%(asctime)s:%(levelname)s:%(message)s")
 
@@ -39,6 +41,14 @@ def search_by_description(transactions: List[Dict], query: str) -> List[Dict]:
         raise
 
 
+# Searches for transactions of a single card matching the given query description.
+def search_card_by_description(
+    transactions: List[Dict], card_index: Dict[str, Any], card_number: Any, query: str
+) -> List[Dict]:
+    card_transactions = get_card_operations(transactions, card_index, card_number)  # Lookup in the card index.
+    return search_by_description(card_transactions, query)
+
+
 # Writes data to a JSON file and outputs it to the console.
 def write_to_json(file_path: str, data: List[Dict]) -> None:
     try:
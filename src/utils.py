@@ -1,5 +1,6 @@
 import json  # import library JSON for work with it.
-from typing import Any  # Import Any for type annotations.
+import logging  # Import logging library for logging events.
+from typing import Any, Dict, List, Optional  # Import type annotations for better code.
 
 import pandas as pd  # import pandas for data processing and analysis.
 
@@ -14,3 +15,42 @@ def load_xlsx_data(xlsx_path: str) -> Any:
 def save_to_json(data: dict, file_path: str) -> None:
     with open(file_path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=4, ensure_ascii=False)
+
+
+# Normalizes a card number to the suffix used as the card index key.
+def normalize_card_number(card_number: Any) -> Optional[str]:
+    if card_number is None or pd.isna(card_number):
+        return None
+    return str(card_number).strip()[-5:]  # Get the last 5 digits of the card number.
+
+
+# Builds the card index: card suffix -> row offsets and precomputed spent and bonus totals.
+def build_card_index(ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+    cards: Dict[str, Dict[str, Any]] = {}
+    missing_rows: List[int] = []
+    for offset, op in enumerate(ops):
+        card_end = normalize_card_number(op.get("Номер карты"))
+        if card_end is None:
+            missing_rows.append(offset)
+            continue
+        if card_end not in cards:
+            cards[card_end] = {"end_digits": card_end, "rows": [], "spent": 0.0, "bonus": 0.0}
+        entry = cards[card_end]
+        entry["rows"].append(offset)
+        transaction_amount = op.get("Сумма операции", 0)
+        if transaction_amount < 0:
+            entry["spent"] += abs(transaction_amount)
+        entry["bonus"] += op.get("Бонусы (включая кэшбэк)", 0.0)
+    if missing_rows:
+        logging.warning(f"Операций без номера карты: {len(missing_rows)}")
+    return {"cards": cards, "missing_rows": missing_rows}
+
+
+# Returns the operations of a single card using the row offsets from the card index.
+def get_card_operations(
+    ops: List[Dict[str, Any]], card_index: Dict[str, Any], card_number: Any
+) -> List[Dict[str, Any]]:
+    entry = card_index["cards"].get(normalize_card_number(card_number))
+    if entry is None:
+        return []
+    return [ops[offset] for offset in entry["rows"]]
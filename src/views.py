@@ -8,7 +8,8 @@ import requests  # Import requests for making HTTP requests.
 import yfinance as yf  # Import yfinance for fetching stock data.
 from dotenv import load_dotenv  # Import dotenv for loading environment variables.
 
-from src.utils import load_xlsx_data, save_to_json  # import a desired function
+from src.utils import (build_card_index, load_xlsx_data, normalize_card_number,  # import a desired function
+                       save_to_json)
 
 # Logging Setup
 logging.basicConfig(filename="views.log", level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -53,24 +54,26 @@ def sum_expenses(df: pd.DataFrame) -> float:
         raise
 
 
+# Returns the card usage information (end digits, spent and bonus) of a card index entry.
+def card_usage_record(entry: Dict[str, Any]) -> Dict[str, Any]:
+    return {"end_digits": entry["end_digits"], "spent": entry["spent"], "bonus": entry["bonus"]}
+
+
 # Analyzes card usage by transaction
-def analyze_card_usage(ops: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    usage_info = {}
-    for op in ops:
-        card_number = op.get("Номер карты")  # Get card number from operation.
-        if card_number is not None:
-            card_number_str = str(card_number)
-            card_end = card_number_str[-5:]  # Get the last 5 digits of the card number.
-            if card_end not in usage_info:
-                usage_info[card_end] = {"end_digits": card_end, "spent": 0.0, "bonus": 0.0}
-            transaction_amount = op.get("Сумма операции", 0)
-            bonuses_including_cashback = op.get("Бонусы (включая кэшбэк)", 0.0)
-            if transaction_amount < 0:
-                usage_info[card_end]["spent"] += abs(transaction_amount)
-            usage_info[card_end]["bonus"] += bonuses_including_cashback
-        else:
-            print("Внимание: Операция без номера карты:", op)
-    return list(usage_info.values())  # Return the usage information.
+def analyze_card_usage(
+    ops: List[Dict[str, Any]], card_index: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    if card_index is None:
+        card_index = build_card_index(ops)
+    return [card_usage_record(entry) for entry in card_index["cards"].values()]  # Return the usage information.
+
+
+# Returns the spent and bonus totals of a single card from the card index.
+def get_card_usage(card_index: Dict[str, Any], card_number: Any) -> Optional[Dict[str, Any]]:
+    entry = card_index["cards"].get(normalize_card_number(card_number))
+    if entry is None:
+        return None
+    return card_usage_record(entry)
 
 
 # Returns the five largest transactions.
@@ -115,6 +118,7 @@ def main_views() -> None:
         greeting = welcome_message(None)
         print(greeting)
         transactions_list = load_xlsx_data("../data/operations.xls")
+        card_index = build_card_index(transactions_list)
 
         # Create a DataFrame from the transaction list
         transactions_df = pd.DataFrame(transactions_list)
@@ -124,8 +128,9 @@ def main_views() -> None:
         print(f"Общая сумма расходов: {total_expenses}")
 
         # Analyzing the use of maps
-        card_usage = analyze_card_usage(transactions_list)
+        card_usage = analyze_card_usage(transactions_list, card_index)
         print(f"Информация об использовании карт: {card_usage}")
+        print(f"Операций без номера карты: {len(card_index['missing_rows'])}")
 
         # Get the largest transactions in the new format
         largest_ops = largest_transactions(transactions_list)
@@ -0,0 +1,156 @@
+import gzip
+import json
+from typing import Any, Dict, List
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from src.export import (CARD_USAGE_SCHEMA, OPERATIONS_SCHEMA, check_export_format, conform_record, export_arrow,
+                        export_dataset, export_ndjson, export_parquet, main_export, read_arrow, read_ndjson,
+                        read_parquet)
+from src.reports import calculate_expenses
+
+
+@pytest.fixture
+def card_usage_data() -> List[Dict[str, Any]]:
+    return [
+        {"bonus": 10.0, "end_digits": "*7197", "spent": 100.0},
+        {"end_digits": "*4556", "spent": float("nan")},
+    ]
+
+
+def test_conform_record() -> None:
+    record = {"spent": float("nan"), "extra": 1, "end_digits": "*7197"}
+    result = conform_record(record, CARD_USAGE_SCHEMA)
+    assert list(result) == list(CARD_USAGE_SCHEMA)
+    assert result == {"end_digits": "*7197", "spent": None, "bonus": None}
+
+
+def test_export_ndjson_round_trip(tmp_path: Any, card_usage_data: List[Dict[str, Any]]) -> None:
+    file_path = str(tmp_path / "card_usage.ndjson.gz")
+    assert export_ndjson(card_usage_data, file_path, CARD_USAGE_SCHEMA, chunk_size=1) == 2
+    with gzip.open(file_path, "rt", encoding="utf-8") as f:
+        assert list(json.loads(f.readline())) == list(CARD_USAGE_SCHEMA)
+    assert list(read_ndjson(file_path)) == [
+        {"end_digits": "*7197", "spent": 100.0, "bonus": 10.0},
+        {"end_digits": "*4556", "spent": None, "bonus": None},
+    ]
+
+
+def test_export_dataset_ndjson(tmp_path: Any, card_usage_data: List[Dict[str, Any]]) -> None:
+    file_path = export_dataset(card_usage_data, str(tmp_path), "card_usage", CARD_USAGE_SCHEMA)
+    assert file_path.endswith("card_usage.ndjson.gz")
+    assert len(list(read_ndjson(file_path))) == 2
+
+
+def test_export_dataset_unknown_format(tmp_path: Any, card_usage_data: List[Dict[str, Any]]) -> None:
+    with pytest.raises(ValueError):
+        export_dataset(card_usage_data, str(tmp_path), "card_usage", CARD_USAGE_SCHEMA, "csv")
+
+
+def test_conform_record_types() -> None:
+    result = conform_record({"Номер карты": 1234567890123456, "Сумма операции": -100}, OPERATIONS_SCHEMA)
+    assert result["Номер карты"] == "1234567890123456"
+    assert isinstance(result["Сумма операции"], float)
+
+
+def test_check_export_format_unknown() -> None:
+    with pytest.raises(ValueError):
+        check_export_format("csv")
+
+
+@patch("src.export.load_xlsx_data")
+@patch("importlib.util.find_spec", return_value=None)
+def test_main_export_parquet_without_pyarrow(mock_find_spec: Mock, mock_load: Mock, tmp_path: Any) -> None:
+    with pytest.raises(ImportError):
+        main_export("Перевод", "Супермаркеты", "2021-12-31", str(tmp_path), "parquet")
+    mock_load.assert_not_called()
+
+
+def test_export_parquet_schema(tmp_path: Any, card_usage_data: List[Dict[str, Any]]) -> None:
+    pa = pytest.importorskip("pyarrow")
+    expected_schema = pa.schema([("end_digits", pa.string()), ("spent", pa.float64()), ("bonus", pa.float64())])
+
+    file_path = str(tmp_path / "card_usage.parquet")
+    assert export_parquet(card_usage_data, file_path, CARD_USAGE_SCHEMA) == 2
+    table = read_parquet(file_path)
+    assert table.schema.equals(expected_schema)
+    assert table.to_pylist()[1] == {"end_digits": "*4556", "spent": None, "bonus": None}
+
+    empty_path = str(tmp_path / "empty.parquet")
+    export_parquet([], empty_path, CARD_USAGE_SCHEMA)
+    assert read_parquet(empty_path).schema.equals(expected_schema)
+
+
+@pytest.fixture
+def operations_data() -> List[Dict[str, Any]]:
+    return [
+        {"Дата операции": "01.03.2024 10:00:00", "Дата платежа": "01.03.2024", "Номер карты": "*7197",
+         "Сумма операции": -100.0, "Сумма платежа": -100.0, "Категория": "Супермаркеты", "Описание": "Колхоз"},
+        {"Дата операции": "15.01.2024 10:00:00", "Дата платежа": "15.01.2024", "Номер карты": "*7197",
+         "Сумма операции": -40.0, "Сумма платежа": -40.0, "Категория": "Супермаркеты", "Описание": "Перевод"},
+        {"Дата операции": "01.10.2023 10:00:00", "Дата платежа": "01.10.2023", "Номер карты": "*4556",
+         "Сумма операции": -70.0, "Сумма платежа": -70.0, "Категория": "Супермаркеты", "Описание": "Колхоз"},
+        {"Дата операции": "20.02.2024 10:00:00", "Дата платежа": "20.02.2024", "Номер карты": "*4556",
+         "Сумма операции": -30.0, "Сумма платежа": -30.0, "Категория": "Фастфуд", "Описание": "Перевод"},
+    ]
+
+
+def test_export_ndjson_streams_iterable(tmp_path: Any, card_usage_data: List[Dict[str, Any]]) -> None:
+    file_path = str(tmp_path / "card_usage.ndjson.gz")
+    assert export_ndjson(iter(card_usage_data * 3), file_path, CARD_USAGE_SCHEMA, chunk_size=4) == 6
+    assert len(list(read_ndjson(file_path))) == 6
+
+
+def test_export_parquet_row_groups(tmp_path: Any, card_usage_data: List[Dict[str, Any]]) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    file_path = str(tmp_path / "card_usage.parquet")
+    assert export_parquet(iter(card_usage_data * 3), file_path, CARD_USAGE_SCHEMA, chunk_size=4) == 6
+    assert pq.ParquetFile(file_path).num_row_groups == 2
+    assert read_parquet(file_path).to_pylist()[:2] == [
+        {"end_digits": "*7197", "spent": 100.0, "bonus": 10.0},
+        {"end_digits": "*4556", "spent": None, "bonus": None},
+    ]
+
+
+def test_export_arrow_round_trip(tmp_path: Any, card_usage_data: List[Dict[str, Any]]) -> None:
+    pa = pytest.importorskip("pyarrow")
+    file_path = str(tmp_path / "card_usage.arrow")
+    assert export_arrow(iter(card_usage_data * 3), file_path, CARD_USAGE_SCHEMA, chunk_size=4) == 6
+    with pa.memory_map(file_path, "r") as source:
+        assert pa.ipc.open_file(source).num_record_batches == 2
+    table = read_arrow(file_path)
+    expected_schema = pa.schema([("end_digits", pa.string()), ("spent", pa.float64()), ("bonus", pa.float64())])
+    assert table.schema.equals(expected_schema)
+    assert table.to_pylist()[:2] == [
+        {"end_digits": "*7197", "spent": 100.0, "bonus": 10.0},
+        {"end_digits": "*4556", "spent": None, "bonus": None},
+    ]
+
+
+@patch("src.export.load_xlsx_data")
+def test_main_export(mock_load: Mock, tmp_path: Any, operations_data: List[Dict[str, Any]]) -> None:
+    mock_load.return_value = [dict(op) for op in operations_data]
+    exported = main_export("Колхоз", "Супермаркеты", "2024-03-01", str(tmp_path))
+
+    assert [path.rsplit("/", 1)[-1] for path in exported] == [
+        "search_results.ndjson.gz",
+        "category_report.ndjson.gz",
+        "card_usage.ndjson.gz",
+        "top_transactions.ndjson.gz",
+    ]
+    assert all((tmp_path / path.rsplit("/", 1)[-1]).exists() for path in exported)
+
+    category_report = list(read_ndjson(str(tmp_path / "category_report.ndjson.gz")))
+    assert [row["Дата платежа"] for row in category_report] == ["01.03.2024", "15.01.2024"]
+    assert all(row["Категория"] == "Супермаркеты" for row in category_report)
+
+    expenses = json.loads(
+        calculate_expenses(pd.DataFrame(operations_data), "Супермаркеты", pd.Timestamp("2024-03-01"))
+    )
+    assert sum(row["Сумма платежа"] for row in category_report) == expenses["Общие расходы"]
+
+
+if __name__ == "__main__":
+    pytest.main()
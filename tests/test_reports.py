@@ -1,3 +1,4 @@
+import json
 import unittest
 from datetime import datetime
 from unittest.mock import MagicMock, patch
@@ -5,7 +6,8 @@ from unittest.mock import MagicMock, patch
 import pandas as pd
 import pytest
 
-from src.reports import calculate_expenses, find_transactions
+from src.reports import calculate_card_expenses, calculate_expenses, find_transactions
+from src.utils import build_card_index
 
 
 class TestFinancialAnalysis(unittest.TestCase):
@@ -52,5 +54,19 @@ def test_find_transactions_exception(monkeypatch):
     assert "Ошибка чтения файла" in str(e.value)
 
 
+def test_calculate_card_expenses() -> None:
+    transactions = [
+        {"Номер карты": "*7197", "Сумма операции": -100.0, "Категория": "Супермаркеты"},
+        {"Номер карты": "*4556", "Сумма операции": -300.0, "Категория": "Супермаркеты"},
+        {"Номер карты": "*7197", "Сумма операции": -50.0, "Категория": "Фастфуд"},
+        {"Номер карты": "*7197", "Сумма операции": 20.0, "Категория": "Пополнения"},
+        {"Номер карты": "*7197", "Сумма операции": -25.0, "Категория": "Супермаркеты"},
+    ]
+    card_index = build_card_index(transactions)
+    result = json.loads(calculate_card_expenses(transactions, card_index, "*7197"))
+    assert result["Количество операций"] == 4
+    assert result["Расходы по категориям"] == {"Супермаркеты": 125.0, "Фастфуд": 50.0}
+
+
 if __name__ == "__main__":
     unittest.main()
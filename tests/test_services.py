@@ -3,7 +3,8 @@ from unittest.mock import patch
 
 import pytest
 
-from src.services import read_transactions_xls, search_by_description, write_to_json
+from src.services import read_transactions_xls, search_by_description, search_card_by_description, write_to_json
+from src.utils import build_card_index
 
 
 @pytest.fixture
@@ -101,5 +102,16 @@ def test_logging_on_error(mock_logging_error: Any) -> None:
         mock_logging_error.assert_called_with("Ошибка при чтении файла: Ошибка")
 
 
+def test_search_card_by_description() -> None:
+    transactions = [
+        {"Номер карты": "*7197", "Описание": "Перевод средств"},
+        {"Номер карты": "*4556", "Описание": "Перевод средств"},
+        {"Номер карты": "*7197", "Описание": "Оплата услуг"},
+    ]
+    card_index = build_card_index(transactions)
+    result = search_card_by_description(transactions, card_index, "*7197", "Перевод")
+    assert result == [transactions[0]]
+
+
 if __name__ == "__main__":
     pytest.main()
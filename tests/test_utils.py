@@ -0,0 +1,48 @@
+from typing import Any, Dict, List
+
+import pytest
+
+from src.utils import build_card_index, get_card_operations, normalize_card_number
+
+
+@pytest.fixture
+def card_operations_data() -> List[Dict[str, Any]]:
+    return [
+        {"Номер карты": "*7197", "Сумма операции": -100.0, "Бонусы (включая кэшбэк)": 2},
+        {"Номер карты": float("nan"), "Сумма операции": -50.0, "Бонусы (включая кэшбэк)": 0},
+        {"Номер карты": "*7197", "Сумма операции": 30.0, "Бонусы (включая кэшбэк)": 1},
+        {"Номер карты": None, "Сумма операции": -10.0, "Бонусы (включая кэшбэк)": 0},
+    ]
+
+
+@pytest.mark.parametrize(
+    "card_number, expected_end",
+    [
+        (1234567890123456, "23456"),
+        ("*7197", "*7197"),
+        (" *7197 ", "*7197"),
+        (None, None),
+        (float("nan"), None),
+    ],
+)
+def test_normalize_card_number(card_number: Any, expected_end: Any) -> None:
+    assert normalize_card_number(card_number) == expected_end
+
+
+def test_build_card_index(card_operations_data: List[Dict[str, Any]]) -> None:
+    card_index = build_card_index(card_operations_data)
+    assert card_index["cards"] == {"*7197": {"end_digits": "*7197", "rows": [0, 2], "spent": 100.0, "bonus": 3.0}}
+    assert card_index["missing_rows"] == [1, 3]
+
+
+def test_get_card_operations(card_operations_data: List[Dict[str, Any]]) -> None:
+    card_index = build_card_index(card_operations_data)
+    assert get_card_operations(card_operations_data, card_index, "*7197") == [
+        card_operations_data[0],
+        card_operations_data[2],
+    ]
+    assert get_card_operations(card_operations_data, card_index, "00000") == []
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -5,8 +5,9 @@ import pandas as pd
 import pytest
 import requests
 
-from src.views import (analyze_card_usage, fetch_currency_value, get_stock_currency, load_xlsx_data, save_to_json,
-                       sum_expenses, welcome_message)
+from src.utils import build_card_index
+from src.views import (analyze_card_usage, fetch_currency_value, get_card_usage, get_stock_currency, load_xlsx_data,
+                       save_to_json, sum_expenses, welcome_message)
 
 
 @pytest.fixture
@@ -139,5 +140,12 @@ def test_welcome_message_unreachable_code():
         welcome_message("2024-06-22 24:00:00")
 
 
+def test_get_card_usage(card_operations_data: List[Dict[str, Any]]) -> None:
+    card_index = build_card_index(card_operations_data)
+    assert get_card_usage(card_index, 1234567890123456) == {"end_digits": "23456", "spent": 100.0, "bonus": 10.0}
+    assert get_card_usage(card_index, "00000") is None
+    assert analyze_card_usage(card_operations_data, card_index) == analyze_card_usage(card_operations_data)
+
+
 if __name__ == "__main__":
     pytest.main()